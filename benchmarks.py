@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmarks for the SuperApp PDF pipeline.
+
+Usage:
+    python3 benchmarks.py sample large.pdf [--pages 1000]
+    python3 benchmarks.py extract document.pdf [--repeat 3]
+    python3 benchmarks.py ocr scanned.pdf [--pages 20] [--reference reference.txt]
+
+The OCR reference is plain text with pages separated by form feeds, e.g. the
+ground truth that was used to produce a test scan.
+"""
+import argparse
+import difflib
+import random
+import time
+
+import pytesseract
+from pdf2image import convert_from_path
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate
+
+from superapp import PDF_EXTRACTION_BACKENDS, OCREngine, get_extraction_backend
+
+
+def make_sample(args):
+    # A text-layer PDF of fixed, reproducible content for comparing the extraction backends.
+    rng = random.Random(args.seed)
+    words = ("translation document page paragraph language model offline service extraction "
+             "poppler scanner image layer density quality throughput benchmark result").split()
+    style = getSampleStyleSheet()["Normal"]
+    story = []
+    for page in range(args.pages):
+        if page:
+            story.append(PageBreak())
+        for _ in range(6):
+            story.append(Paragraph(" ".join(rng.choice(words) for _ in range(70)), style))
+    SimpleDocTemplate(args.pdf, pagesize=letter).build(story)
+    print(f"wrote {args.pages} pages to {args.pdf}")
+
+
+def run_extraction(backend, pdf_path, repeat):
+    # Returns (best wall time, pages, pages flagged for OCR).
+    best = None
+    pages = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pages = list(backend.extract_pages(pdf_path))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, len(pages), sum(1 for page in pages if page.needs_ocr)
+
+
+def bench_extract(args):
+    results = {}
+    print(f"{'backend':<10} {'pages':>6} {'seconds':>9} {'pages/s':>9} {'to OCR':>7}")
+    for name, backend_class in PDF_EXTRACTION_BACKENDS.items():
+        if not backend_class.available():
+            print(f"{name:<10} skipped (not installed)")
+            continue
+        elapsed, num_pages, ocr_pages = run_extraction(backend_class(), args.pdf, args.repeat)
+        results[name] = elapsed
+        rate = num_pages / elapsed if elapsed else float("inf")
+        print(f"{name:<10} {num_pages:>6} {elapsed:>9.2f} {rate:>9.1f} {ocr_pages:>7}")
+    if "poppler" in results and "pypdf2" in results and results["poppler"]:
+        print(f"poppler speedup over pypdf2: {results['pypdf2'] / results['poppler']:.1f}x")
+
+
+def legacy_ocr(pdf_path, pages):
+    # The previous path: full-colour 200 dpi render and one tesseract process per page.
+    texts = {}
+    for page in pages:
+        images = convert_from_path(pdf_path, dpi=200, first_page=page.page_number, last_page=page.page_number)
+        texts[page.page_number] = pytesseract.image_to_string(images[0]) if images else ""
+    return texts
+
+
+def similarity(a, b):
+    return difflib.SequenceMatcher(None, " ".join(a.split()), " ".join(b.split()), autojunk=False).ratio()
+
+
+def bench_ocr(args):
+    pages = list(get_extraction_backend().extract_pages(args.pdf))[:args.pages]
+    reference = None
+    if args.reference:
+        with open(args.reference, encoding="utf-8") as f:
+            reference = f.read().split("\f")
+    engine = OCREngine()
+    runs = [
+        ("legacy", lambda: legacy_ocr(args.pdf, pages)),
+        ("engine", lambda: engine.ocr_pages(args.pdf, pages)),
+    ]
+    outputs = {}
+    print(f"{'path':<8} {'pages':>6} {'seconds':>9} {'pages/s':>9} {'accuracy':>9}")
+    for name, run in runs:
+        start = time.perf_counter()
+        texts = run()
+        elapsed = time.perf_counter() - start
+        outputs[name] = texts
+        accuracy = "-"
+        if reference:
+            scores = [similarity(texts.get(page.page_number, ""), reference[page.page_number - 1])
+                      for page in pages if page.page_number <= len(reference)]
+            if scores:
+                accuracy = f"{100 * sum(scores) / len(scores):.1f}%"
+        rate = len(pages) / elapsed if elapsed else float("inf")
+        print(f"{name:<8} {len(pages):>6} {elapsed:>9.2f} {rate:>9.1f} {accuracy:>9}")
+    engine.close()
+    if not reference and pages:
+        agreement = sum(similarity(outputs["legacy"][p.page_number], outputs["engine"][p.page_number]) for p in pages) / len(pages)
+        print(f"agreement between paths: {100 * agreement:.1f}% (pass --reference for accuracy)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SuperApp PDF benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    sample = subparsers.add_parser("sample", help="Write a large text PDF for the extract benchmark")
+    sample.add_argument("pdf")
+    sample.add_argument("--pages", type=int, default=1000)
+    sample.add_argument("--seed", type=int, default=0)
+    sample.set_defaults(func=make_sample)
+    extract = subparsers.add_parser("extract", help="Compare PDF text extraction backends")
+    extract.add_argument("pdf")
+    extract.add_argument("--repeat", type=int, default=3)
+    extract.set_defaults(func=bench_extract)
+    ocr = subparsers.add_parser("ocr", help="Compare the OCR engine with per-page pytesseract")
+    ocr.add_argument("pdf")
+    ocr.add_argument("--pages", type=int, default=20, help="Number of pages to OCR")
+    ocr.add_argument("--reference", help="Ground-truth text, pages separated by form feeds")
+    ocr.set_defaults(func=bench_ocr)
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
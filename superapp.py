@@ -1,9 +1,21 @@
 #!/usr/bin/env python3
 import os
+import re
+import time
 import subprocess
 import threading
+import collections
+import heapq
+import itertools
+import queue
 import shutil
+import tempfile
+import json
+import hashlib
+import unicodedata
 import tkinter as tk
+from concurrent.futures import CancelledError, Future
+from xml.sax.saxutils import escape
 from tkinter import filedialog, messagebox, ttk
 
 # ---------------------------
@@ -13,11 +25,1223 @@ from PIL import Image, ImageTk
 import pytesseract
 import PyPDF2
 from argostranslate import translate, package
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+from argostranslate import settings as argos_settings
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
 from reportlab.lib.pagesizes import letter
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.pdfbase.ttfonts import TTFont
 from pdf2image import convert_from_path
 import whisper
+import torch
+
+# Optional: in-process tesseract bindings. Without them OCR falls back to one
+# tesseract process per batch of pages.
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+# =====================================================
+# Shared: resource-aware admission control
+# =====================================================
+GB = 1024 ** 3
+# Memory kept free for the OS and the UI when admitting jobs.
+ADMISSION_MEMORY_HEADROOM = int(float(os.environ.get("SUPERAPP_MEMORY_HEADROOM_GB", 1.0)) * GB)
+# Cores a grant leaves unreserved so another heavy job can still start (None = a quarter).
+ADMISSION_SPARE_CORES = int(os.environ["SUPERAPP_SPARE_CORES"]) if os.environ.get("SUPERAPP_SPARE_CORES") else None
+
+class JobProfile:
+    """Estimated peak RAM and the useful thread count of one heavy job type."""
+    def __init__(self, name, memory, max_threads=None, min_threads=1):
+        self.name = name
+        self.memory = memory
+        # None means the job scales to every core.
+        self.max_threads = max_threads
+        self.min_threads = min_threads
+
+# Whisper figures follow the model sizes published by OpenAI.
+WHISPER_MEMORY = {"tiny": 1 * GB, "base": 1 * GB, "small": 2 * GB, "medium": 5 * GB, "large": 10 * GB}
+PDF_TRANSLATION_PROFILE = JobProfile("pdf-translate", int(1.5 * GB), max_threads=4)
+# Subtitles from cached transcripts: only text translation, bounded by the service's workers.
+SUBTITLE_TRANSLATION_PROFILE = JobProfile("subtitle-translate", GB // 2, max_threads=4)
+FFMPEG_PROFILE = JobProfile("ffmpeg", GB // 2, max_threads=16)
+
+def whisper_profile(model_name):
+    # Whisper on CPU gains little past 8 threads; the rest stay free for other jobs.
+    size = model_name.split(".")[0].split("-")[0]
+    return JobProfile(f"whisper-{model_name}", WHISPER_MEMORY.get(size, 10 * GB), max_threads=8)
+
+class SystemLoadMonitor:
+    """Reads available memory and current CPU use from /proc.
+
+    CPU use comes from the change in /proc/stat between two reads, which
+    reacts within a second instead of lagging like the load average. The
+    load average is only used where /proc/stat is unavailable.
+    """
+    def __init__(self, cpu_count=None, min_interval=0.5):
+        self.cpu_count = cpu_count or os.cpu_count() or 1
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._last_sample = self._read_cpu_times()
+        self._last_time = time.time()
+        self._busy_cores = None
+
+    def _read_cpu_times(self):
+        try:
+            with open("/proc/stat") as f:
+                fields = [int(value) for value in f.readline().split()[1:]]
+            # idle + iowait count as idle time.
+            return sum(fields), fields[3] + (fields[4] if len(fields) > 4 else 0)
+        except (OSError, ValueError, IndexError):
+            return None
+
+    def memory_available(self):
+        try:
+            with open("/proc/meminfo") as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def busy_cores(self):
+        with self._lock:
+            now = time.time()
+            if self._busy_cores is None or now - self._last_time >= self.min_interval:
+                sample = self._read_cpu_times()
+                if sample and self._last_sample and sample[0] > self._last_sample[0]:
+                    total = sample[0] - self._last_sample[0]
+                    idle = sample[1] - self._last_sample[1]
+                    self._busy_cores = self.cpu_count * (total - idle) / total
+                elif sample is None and hasattr(os, "getloadavg"):
+                    self._busy_cores = os.getloadavg()[0]
+                self._last_sample, self._last_time = sample, now
+            return self._busy_cores
+
+    def read(self):
+        # Returns (available memory in bytes, busy cores); None where unknown.
+        return self.memory_available(), self.busy_cores()
+
+def read_process_rss():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+class ResourceGrant:
+    def __init__(self, profile, threads):
+        self.profile = profile
+        self.threads = threads
+
+class AdmissionController:
+    """Decides whether a heavy job may start now and how many threads it gets.
+
+    Memory: a job is admitted when its estimate fits into MemAvailable minus the
+    headroom and minus what already-admitted jobs have reserved but not yet
+    allocated (their reservations less this process's RSS growth since idle).
+    CPU: threads are granted from the cores not reserved by admitted jobs and
+    not busy with work outside them. A grant leaves `spare_cores` unreserved
+    unless that would drop it below the job's minimum, so one large job cannot
+    lock every other heavy job out until it finishes.
+    When nothing admitted is running, a job always starts (with at least its
+    minimum thread count), so an oversized job never waits forever.
+    """
+    def __init__(self, cpu_count=None, headroom=ADMISSION_MEMORY_HEADROOM, load_reader=None,
+                 rss_reader=read_process_rss, spare_cores=ADMISSION_SPARE_CORES):
+        self.cpu_count = cpu_count or os.cpu_count() or 1
+        self.headroom = headroom
+        self.spare_cores = max(1, self.cpu_count // 4) if spare_cores is None else max(0, spare_cores)
+        self.load_reader = load_reader or SystemLoadMonitor(self.cpu_count).read
+        self.rss_reader = rss_reader
+        self._lock = threading.Lock()
+        self._grants = []
+        self._idle_rss = rss_reader()
+        self.last_reason = None
+
+    def try_admit(self, profile):
+        # Returns a ResourceGrant, or None (and sets last_reason) if the job must wait.
+        memory_available, busy_cores = self.load_reader()
+        with self._lock:
+            reserved_memory = sum(grant.profile.memory for grant in self._grants)
+            reserved_threads = sum(grant.threads for grant in self._grants)
+            free_threads = self.cpu_count - reserved_threads
+            if busy_cores is not None:
+                # Outside load: busy cores not accounted for by admitted jobs.
+                free_threads -= max(0.0, busy_cores - reserved_threads)
+            max_threads = profile.max_threads or self.cpu_count
+            threads = min(max_threads, int(free_threads) - self.spare_cores)
+            if threads < profile.min_threads:
+                threads = min(max_threads, int(free_threads))
+            if self._grants:
+                if memory_available is not None:
+                    rss = self.rss_reader()
+                    used = max(0, rss - self._idle_rss) if rss is not None and self._idle_rss is not None else 0
+                    outstanding = max(0, reserved_memory - used)
+                    if profile.memory + outstanding + self.headroom > memory_available:
+                        self.last_reason = "waiting for memory"
+                        return None
+                if threads < profile.min_threads:
+                    self.last_reason = "waiting for CPU"
+                    return None
+            grant = ResourceGrant(profile, max(profile.min_threads, threads))
+            self._grants.append(grant)
+            self.last_reason = None
+            return grant
+
+    def release(self, grant):
+        with self._lock:
+            if grant in self._grants:
+                self._grants.remove(grant)
+            if not self._grants:
+                self._idle_rss = self.rss_reader()
+
+ADMISSION_CONTROLLER = AdmissionController()
+
+# =====================================================
+# Shared: task scheduler
+# =====================================================
+# Job categories, each with its own concurrency limit.
+CPU_TASK = "cpu"
+IO_TASK = "io"
+SUBPROCESS_TASK = "subprocess"
+TASK_CONCURRENCY = {
+    CPU_TASK: int(os.environ.get("SUPERAPP_CPU_JOBS", 2)),
+    IO_TASK: int(os.environ.get("SUPERAPP_IO_JOBS", 4)),
+    SUBPROCESS_TASK: int(os.environ.get("SUPERAPP_SUBPROCESS_JOBS", 2)),
+}
+# Lower values run first.
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 5
+PRIORITY_LOW = 10
+PRIORITY_NAMES = {PRIORITY_HIGH: "High", PRIORITY_NORMAL: "Normal", PRIORITY_LOW: "Low"}
+
+class TaskCancelled(Exception):
+    pass
+
+class CancelToken:
+    """Cooperative cancellation flag handed to every job."""
+    def __init__(self):
+        self._event = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def on_cancel(self, callback):
+        # Runs callback on cancel (immediately if already cancelled), e.g. to kill a subprocess.
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def raise_if_cancelled(self):
+        if self.cancelled:
+            raise TaskCancelled()
+
+class Task:
+    def __init__(self, task_id, name, fn, category, priority, on_success, on_error, on_finally, profile=None):
+        self.id = task_id
+        self.name = name
+        self.fn = fn
+        self.category = category
+        self.priority = priority
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_finally = on_finally
+        self.token = CancelToken()
+        # Resource estimate for admission control; `grant` holds what was admitted.
+        self.profile = profile
+        self.grant = None
+        self.waiting_reason = None
+        self.status = "queued"
+        self.progress = None
+        self.result = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    def set_progress(self, value):
+        self.progress = value
+
+    @property
+    def threads(self):
+        # Thread budget granted by admission control, None if unconstrained.
+        return self.grant.threads if self.grant else None
+
+    def cancel(self):
+        self.token.cancel()
+
+class TaskScheduler:
+    """Application-wide job queue shared by every tab.
+
+    Jobs are queued per category (CPU-heavy, I/O-heavy, subprocess) and
+    started in priority order while the category is below its concurrency
+    limit. Jobs submitted with a JobProfile must also pass the admission
+    controller and are held back until the machine has room for them. Jobs get
+    their Task and should check `task.token` to support cancellation.
+    Completion callbacks and `call_in_tk` calls are queued and run on the Tk
+    loop, never on worker threads.
+    """
+    def __init__(self, limits=TASK_CONCURRENCY, admission=ADMISSION_CONTROLLER, recheck_seconds=1.0):
+        self.limits = dict(limits)
+        self.admission = admission
+        # Held-back jobs are re-checked this often, since system load changes on its own.
+        self.recheck_seconds = recheck_seconds
+        self._last_dispatch = 0.0
+        self._lock = threading.Lock()
+        self._queues = {category: [] for category in self.limits}
+        self._running = {category: 0 for category in self.limits}
+        self._tasks = collections.OrderedDict()
+        self._ids = itertools.count(1)
+        self._tk_calls = queue.Queue()
+        self._tk_root = None
+        self._listeners = []
+
+    def attach(self, tk_root, poll_ms=50):
+        # Start draining queued callbacks on the Tk loop.
+        self._tk_root = tk_root
+        self._poll_ms = poll_ms
+        self._drain_tk_calls()
+
+    def _drain_tk_calls(self):
+        while True:
+            try:
+                callback, args = self._tk_calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                messagebox.showerror("Error", str(e))
+        if time.time() - self._last_dispatch >= self.recheck_seconds:
+            self._dispatch()
+        self._tk_root.after(self._poll_ms, self._drain_tk_calls)
+
+    def call_in_tk(self, callback, *args):
+        # Thread-safe: schedules callback(*args) on the Tk thread.
+        if self._tk_root is None:
+            callback(*args)
+        else:
+            self._tk_calls.put((callback, args))
+
+    def add_listener(self, callback):
+        # Called on the Tk thread whenever a job is queued, started or finished.
+        self._listeners.append(callback)
+
+    def _notify(self):
+        for callback in list(self._listeners):
+            self.call_in_tk(callback)
+
+    def submit(self, name, fn, category=CPU_TASK, priority=PRIORITY_NORMAL,
+               on_success=None, on_error=None, on_finally=None, profile=None):
+        # fn(task) runs on a worker thread. on_success(result), on_error(exception)
+        # and on_finally() run on the Tk thread; cancelled jobs only get on_finally.
+        if category not in self.limits:
+            raise Exception(f"Unknown job category: {category}")
+        task = Task(next(self._ids), name, fn, category, priority, on_success, on_error, on_finally, profile)
+        with self._lock:
+            self._tasks[task.id] = task
+            heapq.heappush(self._queues[category], (priority, task.id, task))
+            self._prune_finished()
+        task.token.on_cancel(lambda: self._cancel_queued(task))
+        self._dispatch()
+        self._notify()
+        return task
+
+    def cancel(self, task_id):
+        task = self._tasks.get(task_id)
+        if task is not None:
+            task.cancel()
+
+    def tasks(self):
+        with self._lock:
+            return list(self._tasks.values())
+
+    def _prune_finished(self, keep=50):
+        finished = [task_id for task_id, task in self._tasks.items() if task.finished_at is not None]
+        for task_id in finished[:max(0, len(finished) - keep)]:
+            del self._tasks[task_id]
+
+    def _cancel_queued(self, task):
+        with self._lock:
+            if task.status != "queued":
+                return
+            task.status = "cancelled"
+            task.finished_at = time.time()
+        if task.on_finally:
+            self.call_in_tk(task.on_finally)
+        self._notify()
+
+    def _can_start(self, task):
+        if self._running[task.category] >= self.limits[task.category]:
+            return False
+        if task.profile is None or task.status != "queued":
+            return True
+        task.grant = self.admission.try_admit(task.profile)
+        task.waiting_reason = None if task.grant else self.admission.last_reason
+        return task.grant is not None
+
+    def _mark_running(self, task):
+        task.status = "running"
+        task.started_at = time.time()
+        self._running[task.category] += 1
+        return task
+
+    def _dispatch(self):
+        to_start = []
+        changed = False
+        with self._lock:
+            self._last_dispatch = time.time()
+            for category, pending in self._queues.items():
+                while pending:
+                    head = pending[0][2]
+                    reason = head.waiting_reason
+                    if not self._can_start(head):
+                        changed = changed or head.waiting_reason != reason
+                        break
+                    task = heapq.heappop(pending)[2]
+                    if task.status != "queued":
+                        continue
+                    to_start.append(self._mark_running(task))
+                if pending and pending[0][2].waiting_reason:
+                    # A job held back for resources only blocks other profiled jobs;
+                    # light jobs without a profile may still use free slots.
+                    for entry in sorted(pending):
+                        task = entry[2]
+                        if self._running[category] >= self.limits[category]:
+                            break
+                        if task.profile is None and task.status == "queued":
+                            pending.remove(entry)
+                            to_start.append(self._mark_running(task))
+                    heapq.heapify(pending)
+        for task in to_start:
+            threading.Thread(target=self._run, args=(task,), daemon=True).start()
+        if to_start or changed:
+            self._notify()
+
+    def _run(self, task):
+        try:
+            task.token.raise_if_cancelled()
+            task.result = task.fn(task)
+            task.token.raise_if_cancelled()
+            task.status = "done"
+            if task.on_success:
+                self.call_in_tk(task.on_success, task.result)
+        except TaskCancelled:
+            task.status = "cancelled"
+        except Exception as e:
+            task.status = "failed"
+            task.error = e
+            if task.on_error:
+                self.call_in_tk(task.on_error, e)
+        finally:
+            task.finished_at = time.time()
+            if task.on_finally:
+                self.call_in_tk(task.on_finally)
+            if task.grant is not None:
+                self.admission.release(task.grant)
+            with self._lock:
+                self._running[task.category] -= 1
+            self._dispatch()
+            self._notify()
+
+TASK_SCHEDULER = TaskScheduler()
+
+def start_cancellable_process(command, token, **popen_kwargs):
+    # Popen that is terminated when the job's token is cancelled.
+    process = subprocess.Popen(command, **popen_kwargs)
+    token.on_cancel(lambda: process.poll() is None and process.terminate())
+    return process
+
+# =====================================================
+# Shared: Argos language packages and installed-language inventory
+# =====================================================
+REQUIRED_LANGUAGE_PAIRS = [
+    ('ko','en'), ('en','ko'),
+    ('de','en'), ('en','de'),
+    ('zh','en'), ('en','zh'),
+    ('es','en'), ('en','es')
+]
+# The package index is only re-downloaded once it is older than this.
+ARGOS_INDEX_TTL_SECONDS = int(os.environ.get("SUPERAPP_ARGOS_INDEX_TTL", 7 * 24 * 3600))
+# Directory of pre-downloaded .argosmodel files, used before any download.
+ARGOS_MODELS_DIR = os.path.expanduser(os.environ.get("SUPERAPP_ARGOS_MODELS_DIR", "~/.superapp/argos-models"))
+# Set SUPERAPP_OFFLINE=1 on air-gapped hosts to never touch the network.
+OFFLINE_MODE = os.environ.get("SUPERAPP_OFFLINE", "") not in ("", "0")
+# Matches e.g. "translate-en_de-1_0.argosmodel" or "en_de.argosmodel".
+ARGOS_MODEL_NAME = re.compile(r"^(?:translate-)?([a-z]{2,3})_([a-z]{2,3})(?:[-_.].*)?\.argosmodel$", re.IGNORECASE)
+
+def refresh_package_index(ttl=ARGOS_INDEX_TTL_SECONDS):
+    # Returns True if a (possibly stale) local index is available afterwards.
+    index_path = getattr(argos_settings, "local_package_index", None)
+    index_path = os.fspath(index_path) if index_path else None
+    has_index = bool(index_path) and os.path.isfile(index_path)
+    if has_index and time.time() - os.path.getmtime(index_path) < ttl:
+        return True
+    if OFFLINE_MODE:
+        return has_index
+    try:
+        package.update_package_index()
+        return True
+    except Exception:
+        # No network: fall back to whatever index is cached.
+        return has_index
+
+def find_local_model_files(models_dir=ARGOS_MODELS_DIR):
+    models = {}
+    if not os.path.isdir(models_dir):
+        return models
+    for name in sorted(os.listdir(models_dir)):
+        match = ARGOS_MODEL_NAME.match(name)
+        if match:
+            pair = (match.group(1).lower(), match.group(2).lower())
+            models[pair] = os.path.join(models_dir, name)
+    return models
+
+class LanguageInventory:
+    """Installed argos languages, loaded once and shared by every tab."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._languages = None
+        self._listeners = []
+
+    def languages(self):
+        with self._lock:
+            if self._languages is None:
+                self._languages = translate.get_installed_languages()
+            return list(self._languages)
+
+    def refresh(self):
+        with self._lock:
+            self._languages = translate.get_installed_languages()
+        self.notify()
+
+    def notify(self):
+        for callback in list(self._listeners):
+            callback()
+
+    def add_listener(self, callback):
+        # Callbacks run on the thread that changed the inventory; use
+        # TASK_SCHEDULER.call_in_tk to touch widgets from them.
+        self._listeners.append(callback)
+
+    def get_language(self, code):
+        return next((lang for lang in self.languages() if lang.code == code), None)
+
+    def has_pair(self, src, tgt):
+        lang = self.get_language(src)
+        if lang is None:
+            return False
+        return any(trans.to_lang.code == tgt for trans in lang.translations_to)
+
+LANGUAGE_INVENTORY = LanguageInventory()
+
+def install_language_pairs(pairs, inventory=LANGUAGE_INVENTORY, models_dir=ARGOS_MODELS_DIR):
+    # Installs missing pairs from the local models directory first and only then
+    # from the (cached) package index. Returns the list of pairs still missing.
+    missing = [pair for pair in pairs if not inventory.has_pair(*pair)]
+    if not missing:
+        return []
+    changed = False
+    local_models = find_local_model_files(models_dir)
+    for pair in list(missing):
+        if pair in local_models:
+            package.install_from_path(local_models[pair])
+            missing.remove(pair)
+            changed = True
+    if missing and not OFFLINE_MODE and refresh_package_index():
+        available_packages = package.get_available_packages()
+        for src, tgt in list(missing):
+            found_package = next((pkg for pkg in available_packages if pkg.from_code == src and pkg.to_code == tgt), None)
+            if found_package:
+                package.install_from_path(found_package.download())
+                missing.remove((src, tgt))
+                changed = True
+    if changed:
+        inventory.refresh()
+    return missing
+
+def start_language_setup(pairs=REQUIRED_LANGUAGE_PAIRS, inventory=LANGUAGE_INVENTORY):
+    # Loads the inventory and installs missing pairs as a background job.
+    def job(task):
+        inventory.languages()
+        inventory.notify()
+        return install_language_pairs(pairs, inventory)
+    return TASK_SCHEDULER.submit(
+        "Language package setup", job, category=IO_TASK, priority=PRIORITY_LOW,
+        on_error=lambda e: messagebox.showerror("Error", f"Language package installation error: {e}"),
+    )
+
+# =====================================================
+# Shared: translation service
+# =====================================================
+# ctranslate2 tuning. inter_threads = texts translated in parallel (one worker
+# thread each), intra_threads = threads per text (0 lets ctranslate2 decide).
+# One thread per text keeps the service's CPU use countable against job grants.
+ARGOS_INTER_THREADS = int(os.environ.get("SUPERAPP_ARGOS_INTER_THREADS", max(1, min(4, (os.cpu_count() or 2) // 2))))
+ARGOS_INTRA_THREADS = int(os.environ.get("SUPERAPP_ARGOS_INTRA_THREADS", 1))
+
+class _TranslationRequest:
+    def __init__(self, pair, text):
+        self.pair = pair
+        self.text = text
+        self.future = Future()
+
+class TranslationService:
+    """Keeps argos models resident and serves translation requests from every tab.
+
+    Requests are queued and picked up by `inter_threads` worker threads, each
+    running its own ctranslate2 translation in parallel. argos translates a
+    text one line at a time, so requests are never merged: a merged request
+    would run serially on one worker while the others sit idle.
+    """
+    def __init__(self, inventory, inter_threads=ARGOS_INTER_THREADS, intra_threads=ARGOS_INTRA_THREADS):
+        self.inventory = inventory
+        self.inter_threads = max(1, inter_threads)
+        self.intra_threads = max(0, intra_threads)
+        self._translations = {}
+        self._translations_lock = threading.Lock()
+        self._pending = collections.deque()
+        self._condition = threading.Condition()
+        self._workers = []
+        # Installed packages changed: drop cached translations so new models are picked up.
+        inventory.add_listener(self.clear_cache)
+
+    def configure(self, inter_threads=None, intra_threads=None):
+        # Thread settings apply to models loaded after the call.
+        if inter_threads is not None:
+            self.inter_threads = max(1, inter_threads)
+        if intra_threads is not None:
+            self.intra_threads = max(0, intra_threads)
+        self.clear_cache()
+        self._start_workers()
+
+    def clear_cache(self):
+        with self._translations_lock:
+            self._translations = {}
+
+    def submit(self, text, from_lang_code, to_lang_code):
+        # Returns a Future resolving to the translated text. Cancelling it drops
+        # the request if no worker has started it yet.
+        request = _TranslationRequest((from_lang_code, to_lang_code), text)
+        self._start_workers()
+        with self._condition:
+            self._pending.append(request)
+            self._condition.notify()
+        return request.future
+
+    def translate(self, text, from_lang_code, to_lang_code):
+        return self.submit(text, from_lang_code, to_lang_code).result()
+
+    def max_in_flight(self, threads=None):
+        # Requests one job should keep submitted: enough to use every worker, but
+        # no more than its admission grant of `threads` cores covers.
+        workers = self.inter_threads
+        if threads:
+            workers = min(workers, max(1, threads // max(1, self.intra_threads)))
+        return workers
+
+    def _start_workers(self):
+        with self._condition:
+            while len(self._workers) < self.inter_threads:
+                worker = threading.Thread(target=self._worker_loop, daemon=True)
+                self._workers.append(worker)
+                worker.start()
+
+    def _get_translation(self, pair):
+        with self._translations_lock:
+            translation = self._translations.get(pair)
+            if translation is None:
+                from_lang = self.inventory.get_language(pair[0])
+                to_lang = self.inventory.get_language(pair[1])
+                if not from_lang or not to_lang:
+                    raise Exception("Translation packages for the selected language pair are not installed.")
+                # argos reads these when it creates the ctranslate2 Translator.
+                argos_settings.inter_threads = self.inter_threads
+                argos_settings.intra_threads = self.intra_threads
+                translation = from_lang.get_translation(to_lang)
+                if translation is None:
+                    raise Exception("Translation packages for the selected language pair are not installed.")
+                self._translations[pair] = translation
+            return translation
+
+    def _next_request(self):
+        with self._condition:
+            while not self._pending:
+                self._condition.wait()
+            return self._pending.popleft()
+
+    def _worker_loop(self):
+        while True:
+            request = self._next_request()
+            # Requests whose Future was cancelled while queued are dropped.
+            if not request.future.set_running_or_notify_cancel():
+                continue
+            try:
+                if request.text.strip():
+                    result = self._get_translation(request.pair).translate(request.text)
+                else:
+                    result = request.text
+            except Exception as e:
+                request.future.set_exception(e)
+            else:
+                request.future.set_result(result)
+
+TRANSLATION_SERVICE = TranslationService(LANGUAGE_INVENTORY)
+
+# =====================================================
+# Shared: PDF text extraction backends
+# =====================================================
+# A page is sent to OCR when its text layer looks unusable:
+#  - fewer than OCR_MIN_CHARS characters,
+#  - more than OCR_MAX_GARBAGE_RATIO garbage characters (control, unassigned or
+#    private-use code points and U+FFFD), or
+#  - images cover at least OCR_IMAGE_COVERAGE of the page while the text density
+#    is below OCR_MIN_CHARS_PER_SQ_INCH (a scan with a thin text layer on top).
+OCR_MIN_CHARS = 10
+OCR_MAX_GARBAGE_RATIO = 0.3
+OCR_IMAGE_COVERAGE = 0.5
+OCR_MIN_CHARS_PER_SQ_INCH = 3.0
+PDF_PAGE_SIZE = re.compile(r"^Page\s+(\d+)\s+size:\s+([\d.]+)\s+x\s+([\d.]+)\s+pts")
+
+class PDFPage:
+    """Text layer and layout facts for one page, as reported by a backend."""
+    def __init__(self, page_number, total_pages, text, width=612.0, height=792.0, image_coverage=None):
+        self.page_number = page_number
+        self.total_pages = total_pages
+        self.text = text or ""
+        self.width = width
+        self.height = height
+        # Fraction of the page area covered by raster images, None if unknown.
+        self.image_coverage = image_coverage
+
+    @property
+    def text_density(self):
+        # Non-whitespace characters per square inch.
+        area = max(self.width * self.height / (72.0 * 72.0), 1.0)
+        return len("".join(self.text.split())) / area
+
+    @property
+    def garbage_ratio(self):
+        chars = "".join(self.text.split())
+        if not chars:
+            return 0.0
+        # Combining marks (Devanagari, Arabic diacritics) and symbols are real text;
+        # only code points a sane text layer never contains count as garbage.
+        bad = sum(1 for ch in chars if ch == "\ufffd" or unicodedata.category(ch)[0] == "C")
+        return bad / len(chars)
+
+    @property
+    def needs_ocr(self):
+        if len(self.text.strip()) < OCR_MIN_CHARS:
+            return True
+        if self.garbage_ratio > OCR_MAX_GARBAGE_RATIO:
+            return True
+        if self.image_coverage is not None and self.image_coverage >= OCR_IMAGE_COVERAGE:
+            return self.text_density < OCR_MIN_CHARS_PER_SQ_INCH
+        return False
+
+class PyPDF2ExtractionBackend:
+    """Pure-Python extraction, one page at a time."""
+    name = "pypdf2"
+
+    @staticmethod
+    def available():
+        return True
+
+    def extract_pages(self, pdf_path):
+        with open(pdf_path, 'rb') as file:
+            reader = PyPDF2.PdfReader(file)
+            num_pages = len(reader.pages)
+            for i, page in enumerate(reader.pages, start=1):
+                box = page.mediabox
+                yield PDFPage(i, num_pages, page.extract_text(), float(box.width), float(box.height))
+
+class PopplerExtractionBackend:
+    """Runs poppler's pdftotext over the whole document in one pass.
+
+    Page sizes come from pdfinfo and image coverage from `pdfimages -list`,
+    neither of which decodes page content, so the classifier costs little.
+    """
+    name = "poppler"
+
+    @staticmethod
+    def available():
+        return all(shutil.which(tool) for tool in ("pdftotext", "pdfinfo"))
+
+    def page_sizes(self, pdf_path):
+        result = subprocess.run(["pdfinfo", "-f", "1", "-l", "999999", pdf_path],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        sizes = {}
+        for line in result.stdout.decode("utf-8", "replace").splitlines():
+            match = PDF_PAGE_SIZE.match(line)
+            if match:
+                sizes[int(match.group(1))] = (float(match.group(2)), float(match.group(3)))
+        return sizes
+
+    def image_areas(self, pdf_path):
+        # Returns {page: image area in square points}. Requires pdfimages.
+        areas = {}
+        result = subprocess.run(["pdfimages", "-list", pdf_path], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        for line in result.stdout.decode("utf-8", "replace").splitlines()[2:]:
+            cols = line.split()
+            if len(cols) < 14 or cols[2] != "image":
+                continue
+            try:
+                page, width, height = int(cols[0]), int(cols[3]), int(cols[4])
+                x_ppi, y_ppi = float(cols[12]), float(cols[13])
+            except ValueError:
+                continue
+            if x_ppi > 0 and y_ppi > 0:
+                areas[page] = areas.get(page, 0.0) + (width * 72.0 / x_ppi) * (height * 72.0 / y_ppi)
+        return areas
+
+    def extract_pages(self, pdf_path):
+        sizes = self.page_sizes(pdf_path)
+        num_pages = len(sizes)
+        coverage_known = shutil.which("pdfimages") is not None
+        areas = self.image_areas(pdf_path) if coverage_known else {}
+        # pdftotext ends every page with a form feed; pages are yielded as soon as they are complete.
+        # stderr goes to a file: a malformed PDF can produce enough warnings to fill a
+        # pipe nobody reads while we block on stdout.
+        stderr_file = tempfile.TemporaryFile()
+        process = subprocess.Popen(["pdftotext", "-enc", "UTF-8", pdf_path, "-"],
+                                   stdout=subprocess.PIPE, stderr=stderr_file)
+        buffer = ""
+        page_number = 0
+        try:
+            for chunk in iter(lambda: process.stdout.read(65536), b""):
+                buffer += chunk.decode("utf-8", "replace")
+                *complete, buffer = buffer.split("\f")
+                for text in complete:
+                    page_number += 1
+                    yield self.make_page(page_number, num_pages, text, sizes, areas, coverage_known)
+            if process.wait() != 0:
+                stderr_file.seek(0)
+                errors = stderr_file.read().decode("utf-8", "replace").strip().splitlines()
+                raise Exception("\n".join(errors[-5:]) or "pdftotext failed.")
+            while page_number < num_pages:
+                page_number += 1
+                yield self.make_page(page_number, num_pages, buffer, sizes, areas, coverage_known)
+                buffer = ""
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+            stderr_file.close()
+
+    def make_page(self, page_number, num_pages, text, sizes, areas, coverage_known):
+        width, height = sizes.get(page_number, (612.0, 792.0))
+        num_pages = max(num_pages, page_number)
+        coverage = None
+        if coverage_known:
+            coverage = min(1.0, areas.get(page_number, 0.0) / max(width * height, 1.0))
+        return PDFPage(page_number, num_pages, text, width, height, coverage)
+
+PDF_EXTRACTION_BACKENDS = {
+    PopplerExtractionBackend.name: PopplerExtractionBackend,
+    PyPDF2ExtractionBackend.name: PyPDF2ExtractionBackend,
+}
+
+def get_extraction_backend(name=None):
+    # SUPERAPP_PDF_BACKEND forces a backend; otherwise poppler is preferred when installed.
+    name = name or os.environ.get("SUPERAPP_PDF_BACKEND")
+    if name:
+        if name not in PDF_EXTRACTION_BACKENDS:
+            raise Exception(f"Unknown PDF extraction backend: {name}")
+        return PDF_EXTRACTION_BACKENDS[name]()
+    for backend in PDF_EXTRACTION_BACKENDS.values():
+        if backend.available():
+            return backend()
+    return PyPDF2ExtractionBackend()
+
+# =====================================================
+# Shared: OCR engine
+# =====================================================
+OCR_LANGUAGE = os.environ.get("SUPERAPP_OCR_LANG", "eng")
+OCR_BATCH_SIZE = int(os.environ.get("SUPERAPP_OCR_BATCH_SIZE", 8))
+# Most pages held back while collecting an OCR batch, so one scanned page in a
+# long text document cannot stall the streaming pipeline.
+OCR_MAX_HELD_PAGES = OCR_BATCH_SIZE * 4
+# Pages are rasterized so their longest edge is about OCR_TARGET_PIXELS,
+# clamped to [OCR_MIN_DPI, OCR_MAX_DPI]. 2200 px is the old 200 dpi Letter
+# render: large pages drop towards 150 dpi, small pages rise towards 300.
+OCR_MIN_DPI = 150
+OCR_MAX_DPI = 300
+OCR_TARGET_PIXELS = int(os.environ.get("SUPERAPP_OCR_TARGET_PIXELS", 2200))
+# Deskew search range, coarse step and final step, in degrees.
+OCR_DESKEW_RANGE = 5.0
+OCR_DESKEW_COARSE_STEP = 1.0
+OCR_DESKEW_STEP = 0.5
+
+def choose_ocr_dpi(width_pt, height_pt):
+    longest_inches = max(width_pt, height_pt, 1.0) / 72.0
+    return int(max(OCR_MIN_DPI, min(OCR_MAX_DPI, OCR_TARGET_PIXELS / longest_inches)))
+
+def otsu_threshold(histogram):
+    total = sum(histogram)
+    weighted_total = sum(i * count for i, count in enumerate(histogram))
+    background = weighted_background = 0
+    best_threshold, best_variance = 127, -1.0
+    for i, count in enumerate(histogram):
+        background += count
+        if background == 0:
+            continue
+        foreground = total - background
+        if foreground == 0:
+            break
+        weighted_background += i * count
+        mean_b = weighted_background / background
+        mean_f = (weighted_total - weighted_background) / foreground
+        variance = background * foreground * (mean_b - mean_f) ** 2
+        if variance > best_variance:
+            best_threshold, best_variance = i, variance
+    return best_threshold
+
+def estimate_skew(gray):
+    # Projection-profile deskew: text lines give the sharpest row profile when level.
+    # Squashing each rotated thumbnail to one pixel wide yields the row means directly.
+    thumb = gray.copy()
+    thumb.thumbnail((800, 800))
+
+    def score(angle):
+        rotated = thumb.rotate(angle, resample=Image.BILINEAR, fillcolor=255)
+        rows = list(rotated.resize((1, rotated.height), Image.BOX).tobytes())
+        return sum((rows[i] - rows[i - 1]) ** 2 for i in range(1, len(rows)))
+
+    # Coarse sweep over the whole range, then refine around the best coarse angle.
+    steps = int(OCR_DESKEW_RANGE / OCR_DESKEW_COARSE_STEP)
+    scores = {step * OCR_DESKEW_COARSE_STEP: score(step * OCR_DESKEW_COARSE_STEP) for step in range(-steps, steps + 1)}
+    coarse = max(scores, key=scores.get)
+    fine_steps = int(OCR_DESKEW_COARSE_STEP / OCR_DESKEW_STEP)
+    for step in range(1 - fine_steps, fine_steps):
+        angle = coarse + step * OCR_DESKEW_STEP
+        if angle not in scores and abs(angle) <= OCR_DESKEW_RANGE:
+            scores[angle] = score(angle)
+    return max(scores, key=scores.get)
+
+def preprocess_page_image(image):
+    # Grayscale, deskew and binarize a rasterized page before OCR.
+    gray = image.convert("L")
+    angle = estimate_skew(gray)
+    if angle:
+        gray = gray.rotate(angle, resample=Image.BICUBIC, expand=True, fillcolor=255)
+    threshold = otsu_threshold(gray.histogram())
+    return gray.point([0 if value <= threshold else 255 for value in range(256)])
+
+class TesserocrOCRBackend:
+    """Keeps one tesseract instance initialised in-process for every page."""
+    name = "tesserocr"
+
+    @staticmethod
+    def available():
+        return tesserocr is not None
+
+    def __init__(self, lang=OCR_LANGUAGE):
+        self.api = tesserocr.PyTessBaseAPI(lang=lang)
+
+    def recognize(self, images, threads=None):
+        texts = []
+        for image in images:
+            self.api.SetImage(image)
+            texts.append(self.api.GetUTF8Text())
+        return texts
+
+    def close(self):
+        self.api.End()
+
+class TesseractBatchOCRBackend:
+    """Feeds a whole batch of page images to one tesseract process via a list file."""
+    name = "tesseract-batch"
+
+    @staticmethod
+    def available():
+        return shutil.which("tesseract") is not None
+
+    def __init__(self, lang=OCR_LANGUAGE):
+        self.lang = lang
+
+    def recognize(self, images, threads=None):
+        temp_dir = tempfile.mkdtemp(prefix="superapp_ocr_")
+        try:
+            paths = []
+            for i, image in enumerate(images):
+                path = os.path.join(temp_dir, f"page_{i:04d}.png")
+                image.save(path)
+                paths.append(path)
+            list_path = os.path.join(temp_dir, "pages.txt")
+            with open(list_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(paths) + "\n")
+            env = dict(os.environ)
+            if threads:
+                env["OMP_THREAD_LIMIT"] = str(threads)
+            result = subprocess.run(["tesseract", list_path, "stdout", "-l", self.lang],
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+            if result.returncode != 0:
+                raise Exception(result.stderr.decode("utf-8", "replace").strip() or "tesseract failed.")
+            # tesseract separates pages with a form feed.
+            texts = result.stdout.decode("utf-8", "replace").split("\f")
+            if len(texts) < len(images):
+                return [pytesseract.image_to_string(image, lang=self.lang) for image in images]
+            return texts[:len(images)]
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def close(self):
+        pass
+
+class OCREngine:
+    """Rasterizes, preprocesses and OCRs PDF pages with a long-lived tesseract backend."""
+    def __init__(self, lang=OCR_LANGUAGE, batch_size=OCR_BATCH_SIZE, preprocess=True):
+        self.lang = lang
+        self.batch_size = max(1, batch_size)
+        self.preprocess = preprocess
+        self._backend = None
+        # tesseract instances are not thread-safe; one batch runs at a time.
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            backend_class = TesserocrOCRBackend if TesserocrOCRBackend.available() else TesseractBatchOCRBackend
+            self._backend = backend_class(self.lang)
+        return self._backend
+
+    def rasterize(self, pdf_path, pages, threads=None):
+        # Consecutive pages that share a dpi are rendered by one pdftoppm call.
+        images = []
+        run = []
+        for page in pages:
+            dpi = choose_ocr_dpi(page.width, page.height)
+            if run and (page.page_number != run[-1][0].page_number + 1 or dpi != run[-1][1]):
+                images.extend(self._render_run(pdf_path, run, threads))
+                run = []
+            run.append((page, dpi))
+        if run:
+            images.extend(self._render_run(pdf_path, run, threads))
+        return images
+
+    def _render_run(self, pdf_path, run, threads=None):
+        first, last, dpi = run[0][0].page_number, run[-1][0].page_number, run[0][1]
+        images = convert_from_path(pdf_path, dpi=dpi, first_page=first, last_page=last, grayscale=True,
+                                   thread_count=max(1, min(threads or 1, len(run))))
+        if len(images) != len(run):
+            raise Exception(f"Could not rasterize pages {first}-{last}.")
+        return images
+
+    def ocr_pages(self, pdf_path, pages, threads=None):
+        # Returns {page_number: text} for the given PDFPage objects. `threads`
+        # caps pdftoppm and tesseract threads (admission control grant).
+        results = {}
+        for start in range(0, len(pages), self.batch_size):
+            batch = pages[start:start + self.batch_size]
+            images = self.rasterize(pdf_path, batch, threads)
+            if self.preprocess:
+                images = [preprocess_page_image(image) for image in images]
+            with self._lock:
+                texts = self.backend.recognize(images, threads)
+            for page, text in zip(batch, texts):
+                results[page.page_number] = text
+        return results
+
+    def close(self):
+        with self._lock:
+            if self._backend is not None:
+                self._backend.close()
+                self._backend = None
+
+OCR_ENGINE = OCREngine()
+
+# =====================================================
+# Shared: PDF fonts and streaming PDF writer
+# =====================================================
+# Built-in reportlab CID fonts for the CJK targets; Helvetica has no glyphs for them.
+CJK_CID_FONTS = {
+    "zh": "STSong-Light",
+    "ja": "HeiseiMin-W3",
+    "ko": "HYSMyeongJo-Medium",
+}
+# TrueType fonts with broad Unicode coverage (Cyrillic, Greek, accented Latin, ...).
+UNICODE_TTF_CANDIDATES = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/dejavu/DejaVuSans.ttf",
+    "/Library/Fonts/Arial Unicode.ttf",
+    "/System/Library/Fonts/Supplemental/Arial Unicode.ttf",
+    "C:\\Windows\\Fonts\\arial.ttf",
+]
+_registered_fonts = {}
+_font_lock = threading.Lock()
+
+def get_pdf_font(lang_code):
+    # Fonts are registered once per process and reused by every render.
+    key = lang_code if lang_code in CJK_CID_FONTS else "unicode"
+    with _font_lock:
+        if key in _registered_fonts:
+            return _registered_fonts[key]
+        font_name = "Helvetica"
+        try:
+            if key in CJK_CID_FONTS:
+                pdfmetrics.registerFont(UnicodeCIDFont(CJK_CID_FONTS[key]))
+                font_name = CJK_CID_FONTS[key]
+            else:
+                for path in UNICODE_TTF_CANDIDATES:
+                    if os.path.isfile(path):
+                        pdfmetrics.registerFont(TTFont("SuperAppUnicode", path))
+                        font_name = "SuperAppUnicode"
+                        break
+        except Exception:
+            font_name = "Helvetica"
+        _registered_fonts[key] = font_name
+        return font_name
+
+class StreamingPDFWriter:
+    """Write translated pages to a PDF incrementally.
+
+    Every source page starts on a new output page. Laid-out pages are flushed
+    to a temporary chunk file every `pages_per_chunk` source pages, so memory
+    stays flat regardless of document length. close() joins the chunks with
+    poppler's pdfunite, which copies pages straight to the output file; only
+    without pdfunite are the chunks merged in memory with PyPDF2.
+    """
+    def __init__(self, output_pdf_path, lang_code="en", pages_per_chunk=25):
+        self.output_pdf_path = output_pdf_path
+        self.pages_per_chunk = pages_per_chunk
+        self.style = ParagraphStyle(
+            "Translated",
+            parent=getSampleStyleSheet()["Normal"],
+            fontName=get_pdf_font(lang_code),
+            wordWrap="CJK" if lang_code in CJK_CID_FONTS else None,
+        )
+        self.temp_dir = tempfile.mkdtemp(prefix="superapp_pdf_")
+        self.chunk_paths = []
+        self.story = []
+        self.pages_in_chunk = 0
+        self.page_count = 0
+
+    def add_page(self, text):
+        if self.pages_in_chunk:
+            self.story.append(PageBreak())
+        added = False
+        for para in (text or "").split('\n\n'):
+            para = para.replace('\n', ' ').strip()
+            if para:
+                self.story.append(Paragraph(escape(para), self.style))
+                self.story.append(Spacer(1, 12))
+                added = True
+        if not added:
+            # Keep blank source pages so page numbers stay aligned.
+            self.story.append(Spacer(1, 12))
+        self.pages_in_chunk += 1
+        if self.pages_in_chunk >= self.pages_per_chunk:
+            self.flush()
+
+    def flush(self):
+        if not self.story:
+            return
+        chunk_path = os.path.join(self.temp_dir, f"chunk_{len(self.chunk_paths):05d}.pdf")
+        doc = SimpleDocTemplate(chunk_path, pagesize=letter)
+        doc.build(self.story)
+        self.page_count += doc.page
+        self.chunk_paths.append(chunk_path)
+        self.story = []
+        self.pages_in_chunk = 0
+
+    def close(self):
+        # Returns the number of pages in the finished PDF.
+        try:
+            self.flush()
+            if not self.chunk_paths:
+                raise Exception("No pages were written.")
+            if len(self.chunk_paths) == 1:
+                shutil.move(self.chunk_paths[0], self.output_pdf_path)
+            elif shutil.which("pdfunite"):
+                result = subprocess.run(["pdfunite", *self.chunk_paths, self.output_pdf_path],
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+                if result.returncode != 0:
+                    errors = result.stderr.decode("utf-8", "replace").strip().splitlines()
+                    raise Exception("\n".join(errors[-5:]) or "pdfunite failed.")
+            else:
+                self.merge_in_memory()
+            return self.page_count
+        finally:
+            self.discard()
+
+    def merge_in_memory(self):
+        writer = PyPDF2.PdfWriter()
+        handles = [open(path, 'rb') for path in self.chunk_paths]
+        try:
+            for handle in handles:
+                for page in PyPDF2.PdfReader(handle).pages:
+                    writer.add_page(page)
+            with open(self.output_pdf_path, 'wb') as out:
+                writer.write(out)
+        finally:
+            for handle in handles:
+                handle.close()
+
+    def discard(self):
+        self.story = []
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+# =====================================================
+# Shared: transcript cache
+# =====================================================
+# Whisper transcripts (and English translate passes), so new subtitle languages only cost text translation.
+TRANSCRIPT_CACHE_DIR = os.path.expanduser(os.environ.get("SUPERAPP_TRANSCRIPT_CACHE", "~/.superapp/transcripts"))
+
+def transcript_cache_path(media_path, model_name, language, whisper_task="transcribe"):
+    # Keyed on path, size and mtime rather than content, so hashing a large video is never needed.
+    # whisper_task is "transcribe" (source language) or "translate" (Whisper's own English output).
+    stat = os.stat(media_path)
+    key = f"{os.path.abspath(media_path)}|{stat.st_size}|{stat.st_mtime_ns}|{model_name}|{language}|{whisper_task}"
+    return os.path.join(TRANSCRIPT_CACHE_DIR, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+def load_cached_transcript(media_path, model_name, language, whisper_task="transcribe"):
+    # Returns a list of {"start", "end", "text"} segments, or None if not cached.
+    try:
+        with open(transcript_cache_path(media_path, model_name, language, whisper_task), encoding="utf-8") as f:
+            return json.load(f)["segments"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+def save_transcript(media_path, model_name, language, segments, whisper_task="transcribe"):
+    # Best effort: returns False if the cache cannot be written (read-only home, full disk).
+    try:
+        path = transcript_cache_path(media_path, model_name, language, whisper_task)
+        os.makedirs(TRANSCRIPT_CACHE_DIR, exist_ok=True)
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"media": os.path.abspath(media_path), "model": model_name, "language": language,
+                           "task": whisper_task, "segments": segments}, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return True
+    except OSError:
+        return False
 
 # =====================================================
 # Tab 1: Media Converter (from supperapp.py)
@@ -98,16 +1322,27 @@ class MediaConverterTab(tk.Frame):
         else:
             command = ["ffmpeg", "-y", "-i", input_file, output_file]
         
-        try:
-            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        def job(task):
+            # -threads is an output option, so it goes right before the output file.
+            threaded_command = command[:-1] + ["-threads", str(task.threads or 0), command[-1]]
+            process = start_cancellable_process(threaded_command, task.token, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
             stdout, stderr = process.communicate()
-            if process.returncode == 0:
-                messagebox.showinfo("Success", "Conversion completed successfully.")
+            task.token.raise_if_cancelled()
+            if process.returncode != 0:
+                error_message = stderr.decode("utf-8", "replace")
+                raise Exception(f"Conversion failed.\n{error_message}")
+
+        def on_error(e):
+            if str(e).startswith("Conversion failed."):
+                messagebox.showerror("Error", str(e))
             else:
-                error_message = stderr.decode("utf-8")
-                messagebox.showerror("Error", f"Conversion failed.\n{error_message}")
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+                messagebox.showerror("Error", f"An error occurred: {str(e)}")
+
+        TASK_SCHEDULER.submit(
+            f"Convert {os.path.basename(input_file)}", job, category=SUBPROCESS_TASK, profile=FFMPEG_PROFILE,
+            on_success=lambda result: messagebox.showinfo("Success", "Conversion completed successfully."),
+            on_error=on_error,
+        )
 
 # =====================================================
 # Tab 2: Offline Translator (from supperapp.py)
@@ -173,28 +1408,36 @@ class OfflineTranslatorTab(tk.Frame):
                 self.text_input.delete("1.0", tk.END)
                 self.text_input.insert(tk.END, f.read())
     
-    def translate_text(self, text, from_lang_code, to_lang_code):
-        installed_languages = translate.load_installed_languages()
-        from_lang = next((lang for lang in installed_languages if lang.code == from_lang_code), None)
-        to_lang = next((lang for lang in installed_languages if lang.code == to_lang_code), None)
-        if not from_lang or not to_lang:
-            raise Exception("Language package not installed. Install the package for your selected language pair.")
-        translation = from_lang.get_translation(to_lang)
-        return translation.translate(text)
-    
     def translate_action(self):
-        try:
-            from_lang = self.from_lang_combo.get()
-            to_lang = self.to_lang_combo.get()
-            text = self.text_input.get("1.0", tk.END)
-            if not text.strip():
-                messagebox.showwarning("Warning", "No text found to translate.")
-                return
-            result = self.translate_text(text, from_lang, to_lang)
-            self.result_text.delete("1.0", tk.END)
-            self.result_text.insert(tk.END, result)
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        from_lang = self.from_lang_combo.get()
+        to_lang = self.to_lang_combo.get()
+        text = self.text_input.get("1.0", tk.END)
+        if not text.strip():
+            messagebox.showwarning("Warning", "No text found to translate.")
+            return
+        if not (LANGUAGE_INVENTORY.get_language(from_lang) and LANGUAGE_INVENTORY.get_language(to_lang)):
+            messagebox.showerror("Error", "Language package not installed. Install the package for your selected language pair.")
+            return
+
+        def job(task):
+            # The job only waits on the translation service, so it runs as a high-priority
+            # I/O job and never queues behind Whisper or PDF work for a CPU slot.
+            future = TRANSLATION_SERVICE.submit(text, from_lang, to_lang)
+            task.token.on_cancel(future.cancel)
+            try:
+                return future.result()
+            except CancelledError:
+                raise TaskCancelled()
+
+        TASK_SCHEDULER.submit(
+            "Translate text", job, category=IO_TASK, priority=PRIORITY_HIGH,
+            on_success=self.show_translation,
+            on_error=lambda e: messagebox.showerror("Error", str(e)),
+        )
+
+    def show_translation(self, result):
+        self.result_text.delete("1.0", tk.END)
+        self.result_text.insert(tk.END, result)
 
 # =====================================================
 # Tab 3: PDF Translator (from supperapp.py)
@@ -209,8 +1452,9 @@ class PDFTranslatorTab(tk.Frame):
         self.translated_current_page = 1
         self.translated_total_pages = 0
         self.language_options = {}
-        self.install_required_language_pairs()  # Install language packages first
-        self.create_widgets()                     # Then create widgets
+        self.create_widgets()
+        # Languages are filled in once the shared inventory has been loaded in the background.
+        LANGUAGE_INVENTORY.add_listener(lambda: TASK_SCHEDULER.call_in_tk(self.update_language_options))
 
     def get_pdf_preview_image(self, pdf_path, page_number=1):
         try:
@@ -222,45 +1466,23 @@ class PDFTranslatorTab(tk.Frame):
         except Exception as e:
             raise Exception("Error generating preview image: " + str(e))
     
-    def install_required_language_pairs(self):
-        try:
-            package.update_package_index()
-            available_packages = package.get_available_packages()
-            required_pairs = [
-                ('ko','en'), ('en','ko'),
-                ('de','en'), ('en','de'),
-                ('zh','en'), ('en','zh'),
-                ('es','en'), ('en','es')
-            ]
-            installed_langs = translate.get_installed_languages()
-
-            def is_pair_installed(src, tgt, installed_langs):
-                for lang in installed_langs:
-                    if lang.code == src:
-                        for trans in lang.translations_to:
-                            if trans.to_lang.code == tgt:
-                                return True
-                return False
-
-            for src, tgt in required_pairs:
-                if not is_pair_installed(src, tgt, installed_langs):
-                    found_package = None
-                    for pkg in available_packages:
-                        if pkg.from_code == src and pkg.to_code == tgt:
-                            found_package = pkg
-                            break
-                    if found_package:
-                        pkg_path = found_package.download()
-                        package.install_from_path(pkg_path)
-                        installed_langs = translate.get_installed_languages()
-        except Exception as e:
-            messagebox.showerror("Error", f"Language package installation error: {e}")
-        
+    def update_language_options(self):
         # Build language options from installed languages.
-        for lang in translate.get_installed_languages():
+        self.language_options = {}
+        for lang in LANGUAGE_INVENTORY.languages():
             name = getattr(lang, "name", lang.code)
             display = f"{name} ({lang.code})"
             self.language_options[display] = lang.code
+        language_list = list(self.language_options.keys())
+        source, target = self.source_lang_combo.get(), self.target_lang_combo.get()
+        self.source_lang_combo.config(values=language_list)
+        self.target_lang_combo.config(values=language_list)
+        if not language_list:
+            return
+        if source not in self.language_options:
+            self.source_lang_combo.current(0)
+        if target not in self.language_options:
+            self.target_lang_combo.current(1 if len(language_list) > 1 else 0)
 
     def create_widgets(self):
         # Top control frame
@@ -276,17 +1498,10 @@ class PDFTranslatorTab(tk.Frame):
         # Language selection
         tk.Label(control_frame, text="Source Language:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
         tk.Label(control_frame, text="Target Language:").grid(row=2, column=0, padx=5, pady=5, sticky="e")
-        language_list = list(self.language_options.keys()) if self.language_options else []
-        self.source_lang_combo = ttk.Combobox(control_frame, values=language_list, state="readonly")
+        self.source_lang_combo = ttk.Combobox(control_frame, values=[], state="readonly")
         self.source_lang_combo.grid(row=1, column=1, padx=5, pady=5)
-        if language_list:
-            self.source_lang_combo.current(0)
-        self.target_lang_combo = ttk.Combobox(control_frame, values=language_list, state="readonly")
+        self.target_lang_combo = ttk.Combobox(control_frame, values=[], state="readonly")
         self.target_lang_combo.grid(row=2, column=1, padx=5, pady=5)
-        if len(language_list) > 1:
-            self.target_lang_combo.current(1)
-        else:
-            self.target_lang_combo.current(0)
 
         # Translate button
         self.translate_button = tk.Button(control_frame, text="Translate PDF", command=self.translate_pdf)
@@ -333,7 +1548,8 @@ class PDFTranslatorTab(tk.Frame):
         self.next_trans_button.pack(side=tk.LEFT, padx=5, pady=2)
 
     def update_progress(self, value):
-        self.progress_bar.config(value=value)
+        # Safe to call from job threads.
+        TASK_SCHEDULER.call_in_tk(lambda: self.progress_bar.config(value=value))
     
     def select_pdf(self):
         file_path = filedialog.askopenfilename(title="Select PDF File", filetypes=[("PDF files", "*.pdf")])
@@ -405,57 +1621,61 @@ class PDFTranslatorTab(tk.Frame):
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save PDF: {str(e)}")
     
-    def extract_text_from_pdf(self, pdf_path, progress_callback=None):
-        text = ""
+    def iter_pdf_pages(self, pdf_path, threads=None):
+        # Yields (page_number, total_pages, text) in page order. Pages that need OCR
+        # are held back until a batch of them is ready, so tesseract sees several at
+        # once. A window always starts at its oldest OCR page, so capping its length
+        # also bounds how far that page can lag behind extraction.
         try:
-            with open(pdf_path, 'rb') as file:
-                reader = PyPDF2.PdfReader(file)
-                num_pages = len(reader.pages)
-                for i, page in enumerate(reader.pages, start=1):
-                    page_text = page.extract_text()
-                    if page_text and page_text.strip():
-                        text += page_text + "\n"
-                    else:
-                        try:
-                            images = convert_from_path(pdf_path, dpi=200, first_page=i, last_page=i)
-                            if images:
-                                ocr_text = pytesseract.image_to_string(images[0])
-                                text += ocr_text + "\n"
-                        except Exception as ocr_e:
-                            raise Exception(f"Error during OCR on page {i}: {ocr_e}")
-                    if progress_callback:
-                        progress_callback((i / num_pages) * 50)
+            window = []
+            ocr_count = 0
+            for page in get_extraction_backend().extract_pages(pdf_path):
+                window.append(page)
+                if page.needs_ocr:
+                    ocr_count += 1
+                if not ocr_count or ocr_count >= OCR_ENGINE.batch_size or len(window) >= OCR_MAX_HELD_PAGES:
+                    yield from self.finish_pages(pdf_path, window, threads)
+                    window = []
+                    ocr_count = 0
+            yield from self.finish_pages(pdf_path, window, threads)
         except Exception as e:
             raise Exception("Error extracting text from PDF: " + str(e))
-        if not text.strip():
-            raise Exception("No text could be extracted from the PDF.")
-        return text
-    
-    def translate_text(self, text, from_lang_code, to_lang_code):
+
+    def finish_pages(self, pdf_path, pages, threads=None):
+        ocr_pages = [page for page in pages if page.needs_ocr]
+        ocr_texts = {}
+        if ocr_pages:
+            try:
+                ocr_texts = OCR_ENGINE.ocr_pages(pdf_path, ocr_pages, threads)
+            except Exception as ocr_e:
+                numbers = ", ".join(str(page.page_number) for page in ocr_pages)
+                label = "page" if len(ocr_pages) == 1 else "pages"
+                raise Exception(f"Error during OCR on {label} {numbers}: {ocr_e}")
+        for page in pages:
+            ocr_text = ocr_texts.get(page.page_number, "")
+            yield page.page_number, page.total_pages, ocr_text if ocr_text.strip() else page.text
+
+    def wait_for_page(self, task, page_number, num_pages, future):
         try:
-            installed_languages = translate.get_installed_languages()
-            from_lang_obj = next((lang for lang in installed_languages if lang.code == from_lang_code), None)
-            to_lang_obj = next((lang for lang in installed_languages if lang.code == to_lang_code), None)
-            if not from_lang_obj or not to_lang_obj:
-                raise Exception("Translation packages for the selected language pair are not installed.")
-            translation = from_lang_obj.get_translation(to_lang_obj)
-            return translation.translate(text)
+            translated = future.result()
         except Exception as e:
-            raise Exception("Error during translation: " + str(e))
-    
-    def create_translated_pdf(self, text, output_pdf_path):
+            raise Exception(f"Error during translation of page {page_number}: {e}")
+        task.set_progress((page_number / num_pages) * 95)
+        self.update_progress(task.progress)
+        return translated
+
+    def create_translated_pdf(self, pages, output_pdf_path, lang_code="en"):
+        # `pages` is an iterable of translated page texts; returns the output page count.
+        writer = StreamingPDFWriter(output_pdf_path, lang_code=lang_code)
         try:
-            doc = SimpleDocTemplate(output_pdf_path, pagesize=letter)
-            styles = getSampleStyleSheet()
-            story = []
-            paragraphs = text.split('\n\n')
-            for para in paragraphs:
-                para = para.replace('\n', ' ')
-                if para.strip():
-                    story.append(Paragraph(para.strip(), styles["Normal"]))
-                    story.append(Spacer(1, 12))
-            doc.build(story)
+            for page_text in pages:
+                writer.add_page(page_text)
+            return writer.close()
+        except TaskCancelled:
+            writer.discard()
+            raise
         except Exception as e:
+            writer.discard()
             raise Exception("Error creating translated PDF: " + str(e))
     
     def translate_pdf(self):
@@ -471,38 +1691,68 @@ class PDFTranslatorTab(tk.Frame):
         self.translate_button.config(state=tk.DISABLED)
         self.save_button.config(state=tk.DISABLED)
         self.update_progress(0)
-
-        def process_translation():
-            try:
-                extracted_text = self.extract_text_from_pdf(self.input_pdf_path, progress_callback=self.update_progress)
-                self.update_progress(50)
-                translated_text = self.translate_text(extracted_text, source_lang, target_lang)
-                self.update_progress(75)
-                self.create_translated_pdf(translated_text, self.output_pdf_path)
-                self.update_progress(100)
-                self.after(0, lambda: messagebox.showinfo("Success", f"Translated PDF saved as {self.output_pdf_path}"))
+        input_pdf_path = self.input_pdf_path
+
+        def process_translation(task):
+            if not (LANGUAGE_INVENTORY.get_language(source_lang) and LANGUAGE_INVENTORY.get_language(target_lang)):
+                raise Exception("Error during translation: Translation packages for the selected language pair are not installed.")
+            found_text = False
+            # Pages are submitted ahead of the writer so the service's workers stay
+            # busy, but only as many as the job's thread grant covers.
+            lookahead = TRANSLATION_SERVICE.max_in_flight(task.threads)
+
+            def translated_pages():
+                nonlocal found_text
+                in_flight = collections.deque()
                 try:
-                    with open(self.output_pdf_path, 'rb') as f:
-                        reader = PyPDF2.PdfReader(f)
-                        self.translated_total_pages = len(reader.pages)
-                except Exception:
-                    self.translated_total_pages = 1
-                self.translated_current_page = 1
-                self.after(0, self.display_translated_preview, self.translated_current_page)
-                if self.translated_total_pages > 1:
-                    self.after(0, lambda: self.prev_trans_button.config(state=tk.NORMAL))
-                    self.after(0, lambda: self.next_trans_button.config(state=tk.NORMAL))
-                else:
-                    self.after(0, lambda: self.prev_trans_button.config(state=tk.DISABLED))
-                    self.after(0, lambda: self.next_trans_button.config(state=tk.DISABLED))
-                self.after(0, lambda: self.save_button.config(state=tk.NORMAL))
-            except Exception as e:
-                self.after(0, lambda: messagebox.showerror("Error", str(e)))
-                self.update_progress(0)
+                    for i, num_pages, page_text in self.iter_pdf_pages(input_pdf_path, task.threads):
+                        task.token.raise_if_cancelled()
+                        if page_text.strip():
+                            found_text = True
+                        in_flight.append((i, num_pages, TRANSLATION_SERVICE.submit(page_text, source_lang, target_lang)))
+                        while len(in_flight) >= lookahead:
+                            yield self.wait_for_page(task, *in_flight.popleft())
+                    while in_flight:
+                        yield self.wait_for_page(task, *in_flight.popleft())
+                finally:
+                    # Cancelled or failed: drop look-ahead pages the service has not started.
+                    for _, _, future in in_flight:
+                        future.cancel()
+
+            # Render next to the output and only replace it once the result is known to be good.
+            partial_path = self.output_pdf_path + ".part"
+            try:
+                total_pages = self.create_translated_pdf(
+                    translated_pages(), partial_path, lang_code=target_lang
+                ) or 1
+                if not found_text:
+                    raise Exception("No text could be extracted from the PDF.")
+                os.replace(partial_path, self.output_pdf_path)
             finally:
-                self.after(0, lambda: self.translate_button.config(state=tk.NORMAL))
-        
-        threading.Thread(target=process_translation).start()
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+            return total_pages
+
+        def on_success(total_pages):
+            self.update_progress(100)
+            self.translated_total_pages = total_pages
+            messagebox.showinfo("Success", f"Translated PDF saved as {self.output_pdf_path}")
+            self.translated_current_page = 1
+            self.display_translated_preview(self.translated_current_page)
+            nav_state = tk.NORMAL if self.translated_total_pages > 1 else tk.DISABLED
+            self.prev_trans_button.config(state=nav_state)
+            self.next_trans_button.config(state=nav_state)
+            self.save_button.config(state=tk.NORMAL)
+
+        def on_error(e):
+            messagebox.showerror("Error", str(e))
+            self.update_progress(0)
+
+        TASK_SCHEDULER.submit(
+            f"Translate {os.path.basename(input_pdf_path)}", process_translation, category=CPU_TASK,
+            profile=PDF_TRANSLATION_PROFILE, on_success=on_success, on_error=on_error,
+            on_finally=lambda: self.translate_button.config(state=tk.NORMAL),
+        )
 
 # =====================================================
 # Tab 4: Video Translator (from supperapp.py)
@@ -550,12 +1800,25 @@ class VideoTranslatorTab(tk.Frame):
         self.language_combobox.grid(row=1, column=1, padx=5, pady=5, sticky="w")
         self.language_combobox.current(0)
 
+        # Subtitle languages; each one gets its own SRT file.
+        tk.Label(self, text="Subtitle Languages:").grid(row=2, column=0, padx=5, pady=5, sticky="nw")
+        target_frame = tk.Frame(self)
+        target_frame.grid(row=2, column=1, padx=5, pady=5, sticky="w")
+        self.target_listbox = tk.Listbox(target_frame, selectmode=tk.MULTIPLE, exportselection=False, height=8)
+        for name in self.languages:
+            self.target_listbox.insert(tk.END, name)
+        self.target_listbox.selection_set(list(self.languages).index("English"))
+        self.target_listbox.pack(side="left")
+        scrollbar = ttk.Scrollbar(target_frame, command=self.target_listbox.yview)
+        scrollbar.pack(side="right", fill="y")
+        self.target_listbox.config(yscrollcommand=scrollbar.set)
+
         # Start button
-        tk.Button(self, text="Start Translation", command=self.start_transcription_wrapper).grid(row=2, column=1, padx=5, pady=15)
+        tk.Button(self, text="Create Subtitles", command=self.start_transcription_wrapper).grid(row=3, column=1, padx=5, pady=15)
 
         # Status label
         self.status_label = tk.Label(self, text="Ready", fg="blue")
-        self.status_label.grid(row=3, column=0, columnspan=3, padx=5, pady=5)
+        self.status_label.grid(row=4, column=0, columnspan=3, padx=5, pady=5)
     
     def browse_file(self):
         filename = filedialog.askopenfilename(
@@ -566,11 +1829,8 @@ class VideoTranslatorTab(tk.Frame):
             self.file_entry.delete(0, tk.END)
             self.file_entry.insert(0, filename)
     
-    def save_file_dialog(self):
-        return filedialog.asksaveasfilename(
-            defaultextension=".srt",
-            filetypes=[("SRT files", "*.srt"), ("All files", "*.*")]
-        )
+    def output_dir_dialog(self, input_file):
+        return filedialog.askdirectory(title="Select folder for subtitle files", initialdir=os.path.dirname(input_file) or None)
     
     def format_time(self, seconds):
         msec = int((seconds - int(seconds)) * 1000)
@@ -582,33 +1842,46 @@ class VideoTranslatorTab(tk.Frame):
     def get_language_code(self):
         selected = self.language_var.get()
         return self.languages.get(selected, selected)
-    
-    def start_transcription(self):
-        input_file = self.file_entry.get()
-        if not input_file:
-            messagebox.showerror("Error", "Please select an input file.")
-            return
 
-        language = self.get_language_code()
-        if language == "":
-            messagebox.showerror("Error", "Please select the language.")
-            return
+    def get_target_codes(self):
+        names = list(self.languages)
+        return [self.languages[names[i]] for i in self.target_listbox.curselection()]
 
+    def write_srt(self, srt_file, segments, texts):
         try:
-            self.status_label.config(text="Loading model...")
-            self.update_idletasks()
-            model = whisper.load_model("large")
+            with open(srt_file, "w", encoding="utf-8") as f:
+                for i, (segment, text) in enumerate(zip(segments, texts), start=1):
+                    start_time = self.format_time(segment["start"])
+                    end_time = self.format_time(segment["end"])
+                    f.write(f"{i}\n{start_time} --> {end_time}\n{text.strip()}\n\n")
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load model: {e}")
-            return
+            raise Exception(f"Failed to save SRT file: {e}")
+
+    def load_model(self, task, model_name, set_status, models):
+        # Loads the Whisper model once per job; `models` caches it between passes.
+        if model_name not in models:
+            set_status("Loading model...")
+            if task.threads:
+                # torch's thread pool is process-wide; the admission grant sizes it for this run.
+                torch.set_num_threads(task.threads)
+            try:
+                models[model_name] = whisper.load_model(model_name)
+            except Exception as e:
+                raise Exception(f"Failed to load model: {e}")
+        return models[model_name]
 
+    def transcribe(self, task, input_file, language, model_name, set_status, whisper_task="transcribe", models=None):
+        # Whisper pass; "transcribe" keeps the source language, "translate" yields English.
+        # Returns deduplicated segments.
+        model = self.load_model(task, model_name, set_status, {} if models is None else models)
+        # Whisper cannot be interrupted mid-pass; cancellation is honoured between steps.
+        task.token.raise_if_cancelled()
+
+        set_status("Transcribing..." if whisper_task == "transcribe" else "Transcribing into English...")
         try:
-            self.status_label.config(text="Transcribing and translating...")
-            self.update_idletasks()
-            result = model.transcribe(input_file, task="translate", language=language)
+            result = model.transcribe(input_file, task=whisper_task, language=language)
         except Exception as e:
-            messagebox.showerror("Error", f"Transcription failed: {e}")
-            return
+            raise Exception(f"Transcription failed: {e}")
 
         # Remove duplicate segments
         filtered_segments = []
@@ -617,24 +1890,153 @@ class VideoTranslatorTab(tk.Frame):
             current_text = segment["text"].strip()
             if current_text == prev_text:
                 continue
-            filtered_segments.append(segment)
+            filtered_segments.append({"start": segment["start"], "end": segment["end"], "text": current_text})
             prev_text = current_text
+        return filtered_segments
+
+    def translate_segments(self, task, segments, language, targets, set_status):
+        # Translates each distinct segment text once per target language.
+        # Returns ({code: [texts]}, {code: error}).
+        unique_texts = list(dict.fromkeys(" ".join(segment["text"].split()) for segment in segments))
+        set_status(f"Translating {len(unique_texts)} lines into {len(targets)} language(s)...")
+        # Lines are submitted ahead so the service's workers stay busy, but only as many
+        # as the job's thread grant covers, and other tabs' requests never wait behind a whole video.
+        lookahead = TRANSLATION_SERVICE.max_in_flight(task.threads)
+        lookups = {code: {} for code in targets}
+        errors = {}
+        in_flight = collections.deque()
+        done, total = 0, max(1, len(targets) * len(unique_texts))
+
+        def collect():
+            nonlocal done
+            code, text, future = in_flight.popleft()
+            task.token.raise_if_cancelled()
+            try:
+                lookups[code][text] = future.result()
+            except Exception as e:
+                errors.setdefault(code, e)
+            done += 1
+            task.set_progress(100 * done / total)
 
-        srt_file = self.save_file_dialog()
-        if not srt_file:
+        try:
+            for code in targets:
+                for text in unique_texts:
+                    if code in errors:
+                        break
+                    in_flight.append((code, text, TRANSLATION_SERVICE.submit(text, language, code)))
+                    while len(in_flight) >= lookahead:
+                        collect()
+            while in_flight:
+                collect()
+        finally:
+            # Cancelled: drop lines the service has not started yet.
+            for _, _, future in in_flight:
+                future.cancel()
+        translations = {
+            code: [lookups[code][" ".join(segment["text"].split())] for segment in segments]
+            for code in targets if code not in errors
+        }
+        return translations, errors
+
+    def start_transcription(self):
+        input_file = self.file_entry.get()
+        if not input_file or not os.path.isfile(input_file):
+            messagebox.showerror("Error", "Please select an input file.")
             return
 
-        try:
-            with open(srt_file, "w", encoding="utf-8") as f:
-                for i, segment in enumerate(filtered_segments, start=1):
-                    start_time = self.format_time(segment["start"])
-                    end_time = self.format_time(segment["end"])
-                    text = segment["text"].strip()
-                    f.write(f"{i}\n{start_time} --> {end_time}\n{text}\n\n")
-            self.status_label.config(text=f"Subtitle saved to {srt_file}")
-            messagebox.showinfo("Success", f"Subtitle saved to:\n{srt_file}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save SRT file: {e}")
+        language = self.get_language_code()
+        if language == "":
+            messagebox.showerror("Error", "Please select the language.")
+            return
+
+        targets = self.get_target_codes()
+        if not targets:
+            messagebox.showerror("Error", "Please select at least one subtitle language.")
+            return
+
+        # Ask for the destination up front so the job never needs the UI.
+        output_dir = self.output_dir_dialog(input_file)
+        if not output_dir:
+            return
+        base = os.path.splitext(os.path.basename(input_file))[0]
+        model_name = "large"
+
+        def set_status(text):
+            TASK_SCHEDULER.call_in_tk(lambda: self.status_label.config(text=text))
+
+        # Without an argos (source, en) pair, English comes from Whisper's own translate pass.
+        whisper_english = "en" in targets and language != "en" and not LANGUAGE_INVENTORY.has_pair(language, "en")
+        argos_targets = [code for code in targets if code != language and not (code == "en" and whisper_english)]
+        whisper_tasks = []
+        if language in targets or argos_targets:
+            whisper_tasks.append("transcribe")
+        if whisper_english:
+            whisper_tasks.append("translate")
+
+        def job(task):
+            models = {}
+            transcripts = {}
+            for whisper_task in whisper_tasks:
+                segments = load_cached_transcript(input_file, model_name, language, whisper_task)
+                if segments is None:
+                    segments = self.transcribe(task, input_file, language, model_name, set_status, whisper_task, models)
+                    # Caching is an optimisation; an unwritable cache must not lose the transcript.
+                    save_transcript(input_file, model_name, language, segments, whisper_task)
+                transcripts[whisper_task] = segments
+                task.token.raise_if_cancelled()
+            models.clear()
+
+            # {code: (segments, texts)}; each language keeps the timings it was produced with.
+            subtitles = {}
+            errors = {}
+            if argos_targets:
+                segments = transcripts["transcribe"]
+                translations, errors = self.translate_segments(task, segments, language, argos_targets, set_status)
+                for code, texts in translations.items():
+                    subtitles[code] = (segments, texts)
+            if language in targets:
+                segments = transcripts["transcribe"]
+                subtitles[language] = (segments, [segment["text"] for segment in segments])
+            if whisper_english:
+                segments = transcripts["translate"]
+                subtitles["en"] = (segments, [segment["text"] for segment in segments])
+
+            written = []
+            for code in targets:
+                if code in subtitles:
+                    srt_file = os.path.join(output_dir, f"{base}.{code}.srt")
+                    self.write_srt(srt_file, *subtitles[code])
+                    written.append(srt_file)
+            return written, errors
+
+        def on_success(result):
+            written, errors = result
+            self.status_label.config(text=f"Saved {len(written)} subtitle file(s) to {output_dir}")
+            message = "Subtitles saved to:\n" + "\n".join(written) if written else "No subtitles were saved."
+            if errors:
+                message += "\n\nFailed:\n" + "\n".join(f"{code}: {e}" for code, e in errors.items())
+                messagebox.showwarning("Finished with errors", message)
+            else:
+                messagebox.showinfo("Success", message)
+
+        def on_error(e):
+            self.status_label.config(text="Ready")
+            messagebox.showerror("Error", str(e))
+
+        # With every needed transcript cached only text translation is left.
+        cached = all(os.path.isfile(transcript_cache_path(input_file, model_name, language, whisper_task))
+                     for whisper_task in whisper_tasks)
+
+        def on_finally():
+            if subtitle_task.status == "cancelled":
+                self.status_label.config(text="Cancelled")
+
+        self.status_label.config(text="Queued...")
+        subtitle_task = TASK_SCHEDULER.submit(
+            f"Subtitles for {os.path.basename(input_file)}", job, category=CPU_TASK,
+            profile=SUBTITLE_TRANSLATION_PROFILE if cached else whisper_profile(model_name),
+            on_success=on_success, on_error=on_error, on_finally=on_finally,
+        )
     
     def start_transcription_wrapper(self):
         # Set the language_var to the code required by Whisper.
@@ -746,54 +2148,62 @@ class VideoDownloaderTab(tk.Frame):
         self.progress_bar.start()
         self.output_text.delete("1.0", tk.END)
 
-        def thread_target():
-            try:
-                tool_path = shutil.which(tool)
-                if not tool_path:
-                    raise FileNotFoundError(f"The tool '{tool}' was not found in your system PATH.")
+        def append_output(line):
+            self.output_text.insert(tk.END, line)
+            self.output_text.see(tk.END)
+
+        def job(task):
+            tool_path = shutil.which(tool)
+            if not tool_path:
+                raise FileNotFoundError(f"The tool '{tool}' was not found in your system PATH.")
+
+            cmd = [tool_path]
+
+            output_path = options.get('output_dir')
+            if output_path:
+                output_path = os.path.expanduser(output_path)
+                if not os.path.exists(output_path):
+                    os.makedirs(output_path)
+
+            if tool == 'yt-dlp':
+                if options.get('audio_only'):
+                    cmd += ['-x', '--audio-format', 'mp3']
+                if options.get('subtitles'):
+                    cmd += ['--write-sub']
+                if options.get('embed_metadata'):
+                    cmd += ['--embed-metadata']
+                if options.get('embed_thumbnail'):
+                    cmd += ['--embed-thumbnail']
+                if options.get('no_check_certificate'):
+                    cmd += ['--no-check-certificate']
+                if options.get('format'):
+                    cmd += ['-f', options['format']]
+                if options.get('cookies'):
+                    cmd += ['--cookies', options['cookies']]
+                if output_path:
+                    cmd += ['-P', output_path]
 
-                cmd = [tool_path]
+            cmd.append(url)
 
-                output_path = options.get('output_dir')
-                if output_path:
-                    output_path = os.path.expanduser(output_path)
-                    if not os.path.exists(output_path):
-                        os.makedirs(output_path)
-
-                if tool == 'yt-dlp':
-                    if options.get('audio_only'):
-                        cmd += ['-x', '--audio-format', 'mp3']
-                    if options.get('subtitles'):
-                        cmd += ['--write-sub']
-                    if options.get('embed_metadata'):
-                        cmd += ['--embed-metadata']
-                    if options.get('embed_thumbnail'):
-                        cmd += ['--embed-thumbnail']
-                    if options.get('no_check_certificate'):
-                        cmd += ['--no-check-certificate']
-                    if options.get('format'):
-                        cmd += ['-f', options['format']]
-                    if options.get('cookies'):
-                        cmd += ['--cookies', options['cookies']]
-                    if output_path:
-                        cmd += ['-P', output_path]
-
-                cmd.append(url)
-
-                process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-                for line in process.stdout:
-                    self.output_text.insert(tk.END, line)
-                    self.output_text.see(tk.END)
+            process = start_cancellable_process(cmd, task.token, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+            for line in process.stdout:
+                TASK_SCHEDULER.call_in_tk(append_output, line)
 
-                process.wait()
-                self.progress_bar.stop()
-                self.progress_var.set(100)
-                messagebox.showinfo("Finished", f"Download with {tool} completed.")
-            except Exception as e:
-                self.progress_bar.stop()
-                messagebox.showerror("Error", str(e))
+            process.wait()
+            task.token.raise_if_cancelled()
+            if process.returncode != 0:
+                raise Exception(f"{tool} exited with code {process.returncode}.")
 
-        threading.Thread(target=thread_target).start()
+        def on_success(result):
+            self.progress_var.set(100)
+            messagebox.showinfo("Finished", f"Download with {tool} completed.")
+
+        TASK_SCHEDULER.submit(
+            f"Download {url}", job, category=SUBPROCESS_TASK,
+            on_success=on_success,
+            on_error=lambda e: messagebox.showerror("Error", str(e)),
+            on_finally=self.progress_bar.stop,
+        )
 
     def download_video(self):
         url = self.url_entry.get()
@@ -809,6 +2219,67 @@ class VideoDownloaderTab(tk.Frame):
         }
         self.run_command('yt-dlp', url, options)
 
+# =====================================================
+# Tab 6: Jobs
+# =====================================================
+class JobsTab(tk.Frame):
+    def __init__(self, master, scheduler=None):
+        super().__init__(master)
+        self.scheduler = scheduler or TASK_SCHEDULER
+        self.create_widgets()
+        self.scheduler.add_listener(self.refresh)
+        self.refresh_periodically()
+
+    def create_widgets(self):
+        columns = ("job", "type", "priority", "status", "progress", "elapsed")
+        headings = ("Job", "Type", "Priority", "Status", "Progress", "Elapsed")
+        widths = (290, 80, 70, 170, 70, 70)
+        frame = tk.Frame(self)
+        frame.pack(fill='both', expand=True, padx=10, pady=10)
+        self.tree = ttk.Treeview(frame, columns=columns, show="headings", selectmode="browse")
+        for column, heading, width in zip(columns, headings, widths):
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width, anchor="w")
+        self.tree.pack(side='left', fill='both', expand=True)
+        scrollbar = ttk.Scrollbar(frame, command=self.tree.yview)
+        scrollbar.pack(side='right', fill='y')
+        self.tree.configure(yscrollcommand=scrollbar.set)
+
+        tk.Button(self, text="Cancel Selected Job", command=self.cancel_selected).pack(pady=10)
+
+    def format_elapsed(self, task):
+        if task.started_at is None:
+            return ""
+        seconds = int((task.finished_at or time.time()) - task.started_at)
+        return f"{seconds // 60}:{seconds % 60:02d}"
+
+    def refresh(self):
+        # Running and queued jobs first, then the most recently finished ones.
+        order = {"running": 0, "queued": 1}
+        tasks = sorted(self.scheduler.tasks(), key=lambda t: (order.get(t.status, 2), t.priority if t.status == "queued" else 0, -t.id))
+        selected = self.tree.selection()
+        self.tree.delete(*self.tree.get_children())
+        for task in tasks:
+            progress = f"{task.progress:.0f}%" if task.progress is not None else ""
+            status = f"{task.status} ({task.waiting_reason})" if task.status == "queued" and task.waiting_reason else task.status
+            if task.status == "running" and task.threads:
+                status = f"running ({task.threads} threads)"
+            values = (task.name, task.category, PRIORITY_NAMES.get(task.priority, task.priority),
+                      status, progress, self.format_elapsed(task))
+            self.tree.insert("", tk.END, iid=str(task.id), values=values)
+        for iid in selected:
+            if self.tree.exists(iid):
+                self.tree.selection_set(iid)
+
+    def refresh_periodically(self):
+        if any(task.status == "running" for task in self.scheduler.tasks()):
+            self.refresh()
+        self.after(1000, self.refresh_periodically)
+
+    def cancel_selected(self):
+        for iid in self.tree.selection():
+            self.scheduler.cancel(int(iid))
+
 # =====================================================
 # Main Application with Notebook (SuperApp)
 # =====================================================
@@ -817,6 +2288,7 @@ class SuperApp(tk.Tk):
         super().__init__()
         self.title("SuperApp")
         self.geometry("900x750")
+        TASK_SCHEDULER.attach(self)
         self.create_tabs()
     
     def create_tabs(self):
@@ -828,12 +2300,16 @@ class SuperApp(tk.Tk):
         tab3 = PDFTranslatorTab(notebook)
         tab4 = VideoTranslatorTab(notebook)
         tab5 = VideoDownloaderTab(notebook)
+        tab6 = JobsTab(notebook)
 
         notebook.add(tab1, text="Media Converter")
         notebook.add(tab2, text="Offline Translator")
         notebook.add(tab3, text="PDF Translator")
         notebook.add(tab4, text="Video Translator")
         notebook.add(tab5, text="Video Downloader")
+        notebook.add(tab6, text="Jobs")
+
+        start_language_setup()
 
 if __name__ == "__main__":
     app = SuperApp()